@@ -22,7 +22,6 @@ import sys
 # pkg
 from . import parsers
 from .args import Args
-from .args import USAGE
 from .configs import Config
 from .env import TempEnv
 from .git import validate_installed_hooks, force_install_hooks, find_git_directory
@@ -152,6 +151,9 @@ def main(argv: Optional[List[str]] = None) -> None:
         log.debug(args)
 
     if args.help:
+        # deferred: `USAGE` is a lazy attribute of `ds.args` (PEP 562)
+        from .args import USAGE
+
         print(USAGE)
         return
 
@@ -4,12 +4,18 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
 from pathlib import Path
-from shlex import join
+from shlex import quote
+from string import ascii_letters
+from string import digits
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+import copy
 import dataclasses
+import os
 
 # pkg
 from .parsers.ds_toml import parse_composite
@@ -18,8 +24,14 @@ from .symbols import ARG_END
 from .symbols import ARG_OPTION
 from .tasks import Task
 
-# NOTE: Used by cog in README.md
-USAGE = """ds: Run dev scripts.
+
+# NOTE: `USAGE` is used by cog in README.md; it is a lazy module attribute
+# (see `__getattr__` below) so importing `ds.args` doesn't pay for the
+# string unless something actually displays the help.
+@lru_cache(maxsize=1)
+def _load_usage() -> str:
+    """Build the usage string on first access."""
+    return """ds: Run dev scripts.
 
 Usage: ds [--help | --version] [--debug]
           [--dry-run]
@@ -139,11 +151,50 @@ $ ds clean --all && ds build && ds test --no-gpu
 """
 
 
+def __getattr__(name: str) -> str:
+    """Defer building `USAGE` until something asks for it (PEP 562)."""
+    if name == "USAGE":
+        return _load_usage()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _opt_prop(option: str) -> str:
     return option[2:].replace("-", "_")
 
 
-@dataclass
+_SAFE_CHARS = frozenset(ascii_letters + digits + "_./=-")
+"""Characters that never need shell quoting."""
+
+
+def _fast_join(parts: List[str]) -> str:
+    """Like `shlex.join`, but skip the regex scan for plainly safe tokens."""
+    return " ".join(
+        part if part and all(c in _SAFE_CHARS for c in part) else quote(part)
+        for part in parts
+    )
+
+
+_BOOL_OUT = tuple(
+    (opt, _opt_prop(opt))
+    for opt in [
+        "--help",
+        "--version",
+        "--debug",
+        "--dry-run",
+        "--no-config",
+        "--no-project",
+        "--pre",
+        "--post",
+        "--parallel",
+    ]
+)
+"""(option, attribute) pairs emitted by `Args.as_argv` for boolean options."""
+
+_PATH_OUT = tuple((opt, _opt_prop(opt)) for opt in ["--cwd", "--env-file", "--file"])
+"""(option, attribute) pairs emitted by `Args.as_argv` for path options."""
+
+
+@dataclass(slots=True)
 class Args:
     """Type-checked arguments."""
 
@@ -210,128 +261,148 @@ class Args:
         result = ["ds"]
 
         # bool
-        for option in [
-            "--help",
-            "--version",
-            "--debug",
-            "--dry-run",
-            "--no-config",
-            "--no-project",
-            "--pre",
-            "--post",
-            "--parallel",
-        ]:
-            if getattr(self, _opt_prop(option)):
+        for option, attr in _BOOL_OUT:
+            if getattr(self, attr):
                 result.append(option)
         if self.list_:
             result.append("--list")
 
         # path
-        for option in ["--cwd", "--env-file", "--file"]:
-            value = getattr(self, _opt_prop(option))
+        for option, attr in _PATH_OUT:
+            value = getattr(self, attr)
             if value:
                 result.extend([option, str(value)])
 
         # workspace
-        if self.workspace:
-            for w in self.workspace:
-                result.extend(["--workspace", w])
+        result += [x for w in self.workspace for x in ("--workspace", w)]
 
         # env
-        for key, val in self.env.items():
-            result.extend(["--env", f"'{key}={val}'"])
+        result += [x for k, v in self.env.items() for x in ("--env", f"'{k}={v}'")]
 
         # tasks
         for t in self.task.depends:
-            parts = join([t.cmd, *t.args])
+            parts = _fast_join([t.cmd, *t.args])
             result.append(parts)
         return result
 
     @staticmethod
     def parse(argv: List[str]) -> Args:
         """Parse command-line arguments in a docopt-like way."""
-        args = Args()
-        tasks: List[str] = []
-        task_cmd = ""
-        is_ours = True
-        is_task_arg = False
-        while argv:
-            arg = argv.pop(0)
-            if is_ours:
+        try:
+            # the cwd is part of the key: path options resolve against it
+            cached = _parse_cached(os.getcwd(), tuple(argv))
+        except TypeError:  # unhashable argv; parse without the cache
+            return _parse_argv(argv)
+
+        # give the caller fresh mutable state so the cache stays clean
+        env = dict(cached.env)
+        task = copy.deepcopy(cached.task)
+        task.env = env  # restore the aliasing set up by `_parse_argv`
+        return dataclasses.replace(
+            cached, env=env, workspace=list(cached.workspace), task=task
+        )
+
+
+def _parse_argv(argv: List[str]) -> Args:
+    """Parse `argv`; `Args.parse` adds caching on top of this."""
+    args = Args()
+    tasks: List[str] = []
+    task_cmd = ""
+    is_ours = True
+    is_task_arg = False
+    i, n = 0, len(argv)
+    while i < n:
+        arg = argv[i]
+        i += 1
+        if is_ours:
+            match arg:
                 # bool
-                if arg in [
-                    "--help",
-                    "--version",
-                    "--debug",
-                    "--dry-run",
-                    "--self-update",
-                    "--no-config",
-                    "--no-project",
-                    "--pre",
-                    "--post",
-                    "--parallel",
-                    "--sync-git-hooks",
-                ]:
-                    attr = _opt_prop(arg)
-                    setattr(args, attr, True)
-                elif arg == "-h":
+                case (
+                    "--help"
+                    | "--version"
+                    | "--debug"
+                    | "--dry-run"
+                    | "--self-update"
+                    | "--no-config"
+                    | "--no-project"
+                    | "--pre"
+                    | "--post"
+                    | "--parallel"
+                    | "--sync-git-hooks"
+                ):
+                    setattr(args, _opt_prop(arg), True)
+                case "-h":
                     args.help = True
-                elif arg in ["-l", "--list"]:
+                case "-l" | "--list":
                     args.list_ = True
 
                 # path
-                elif arg in ["--cwd", "--env-file", "--file"]:
-                    attr = _opt_prop(arg)
-                    setattr(args, attr, Path(argv.pop(0)).resolve())
-                elif arg == "-f":
-                    args.file = Path(argv.pop(0)).resolve()
+                case "--cwd" | "--env-file" | "--file":
+                    setattr(args, _opt_prop(arg), Path(argv[i]).resolve())
+                    i += 1
+                case "-f":
+                    args.file = Path(argv[i]).resolve()
+                    i += 1
 
                 # other
-                elif arg in ["-e", "--env"]:
-                    key, val = argv.pop(0).split("=")
+                case "-e" | "--env":
+                    key, val = argv[i].split("=")
                     args.env[key] = val
-                elif arg in ["-w", "--workspace"]:
-                    args.workspace.append(argv.pop(0))
-                elif arg == "-w*":  # special shorthand
+                    i += 1
+                case "-w" | "--workspace":
+                    args.workspace.append(argv[i])
+                    i += 1
+                case "-w*":  # special shorthand
                     args.workspace.append("*")
-                else:
+                case _:
                     is_ours = False
 
-            if is_ours:
-                continue  # processed
-            # our args processed
+        if is_ours:
+            continue  # processed
+        # our args processed
+
+        if task_cmd and arg == ARG_BEG:  # explicit arg start
+            is_task_arg = True
+            continue  # not an argument
+
+        if arg == ARG_END:  # explicit arg end
+            task_cmd, is_task_arg = "", False
+            continue  # not an argument
+
+        if task_cmd and arg.startswith(ARG_OPTION):  # implicit arg start
+            is_task_arg = True
 
-            if task_cmd and arg == ARG_BEG:  # explicit arg start
-                is_task_arg = True
-                continue  # not an argument
+        if is_task_arg:  # append task args
+            tasks[-1] += f" {arg}"
+            continue  # processed
 
-            if arg == ARG_END:  # explicit arg end
-                task_cmd, is_task_arg = "", False
-                continue  # not an argument
+        if arg.endswith(ARG_BEG):  # task name + explicit arg start
+            arg = arg[: -len(ARG_BEG)]
+            is_task_arg = True
 
-            if task_cmd and arg.startswith(ARG_OPTION):  # implicit arg start
-                is_task_arg = True
+        task_cmd = arg
+        tasks.append(task_cmd)
 
-            if is_task_arg:  # append task args
-                tasks[-1] += f" {arg}"
-                continue  # processed
+    args.task = parse_composite(args.task, tasks)
+    args.task.cwd = args.cwd
+    args.task.env = args.env
+    args.task.env_file = args.env_file
+    args.task.parallel = args.parallel
 
-            if arg.endswith(ARG_BEG):  # task name + explicit arg start
-                arg = arg[: -len(ARG_BEG)]
-                is_task_arg = True
+    if not args.help and not args.version and not args.task.depends:
+        # default action
+        args.list_ = True
 
-            task_cmd = arg
-            tasks.append(task_cmd)
+    # all args processed
+    return args
 
-        args.task = parse_composite(args.task, tasks)
-        args.task.cwd = args.cwd
-        args.task.env = args.env
-        args.task.env_file = args.env_file
-        args.task.parallel = args.parallel
 
-        if not args.help and not args.version and not args.task.depends:
-            # default action
-            args.list_ = True
+@lru_cache(maxsize=32)
+def _parse_cached(cwd: str, argv: Tuple[str, ...]) -> Args:
+    """Memoize parses so repeated identical argv are only parsed once.
 
-        # all args processed
-        return args
+    `cwd` is only part of the key: `--cwd`/`--file`/`--env-file` values
+    resolve against the working directory, so results cannot be shared
+    across directories.
+    """
+    return _parse_argv(list(argv))
@@ -1,9 +1,11 @@
 """Experimental git hooks integration."""
 
 # std
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
-from typing import Literal, Tuple, Union, List
+from typing import Dict, Literal, Tuple, List, get_args
 import os
 import sys
 import stat
@@ -14,7 +16,7 @@ from .tasks import Tasks
 GIT_HOOK_PREFIX = "git-hook-"
 """Hook prefix to look for in the task listing"""
 
-VALID_GIT_HOOKS = [
+ValidGitHookName = Literal[
     "applypatch-msg",
     "commit-msg",
     "fsmonitor-watchman",
@@ -29,26 +31,28 @@ VALID_GIT_HOOKS = [
     "push-to-checkout",
     "update",
 ]
-"""List of all valid git hook names."""
-
-# ValidGitHookName = Literal[*VALID_GIT_HOOKS]
-ValidGitHookName = Union[
-    Literal["applypatch-msg"],
-    Literal["commit-msg"],
-    Literal["fsmonitor-watchman"],
-    Literal["post-update"],
-    Literal["pre-applypatch"],
-    Literal["pre-commit"],
-    Literal["pre-merge-commit"],
-    Literal["pre-push"],
-    Literal["pre-rebase"],
-    Literal["pre-receive"],
-    Literal["prepare-commit-msg"],
-    Literal["push-to-checkout"],
-    Literal["update"],
-]
 """Type listing for all valid git hook names."""
-# which i'd like to be derived from the list above but it doesn't appear to be valid
+
+VALID_GIT_HOOKS: List[str] = list(get_args(ValidGitHookName))
+"""List of all valid git hook names (derived from `ValidGitHookName`)."""
+
+_VALID_HOOKS_SET = frozenset(VALID_GIT_HOOKS)
+"""Hook names as a set for O(1) membership checks."""
+
+_PREFIXED_HOOKS_SET = frozenset(GIT_HOOK_PREFIX + n for n in VALID_GIT_HOOKS)
+"""Prefixed task names for matching hook tasks in a task listing."""
+
+
+@lru_cache(maxsize=len(VALID_GIT_HOOKS))
+def _hook_template(task_name: str, path: str | None, invocation: str) -> str:
+    """Build the hook script; cached so repeated calls skip the dedent."""
+    script = f"""\
+    #! /bin/bash
+
+    PATH="{path}" {invocation} {GIT_HOOK_PREFIX}{task_name}: $@
+    """
+
+    return dedent(script).strip()
 
 
 def create_hook_template(task_name: str) -> str:
@@ -62,57 +66,75 @@ def create_hook_template(task_name: str) -> str:
         str: A string containing the bash script template for the specified git hook.
     """
     # this is probably our best bet
-    invocation = sys.argv[0]
-
-    script = f"""\
-    #! /bin/bash
+    return _hook_template(task_name, os.getenv("PATH"), sys.argv[0])
 
-    PATH="{os.getenv("PATH")}" {invocation} {GIT_HOOK_PREFIX}{task_name}: $@
-    """
 
-    return dedent(script).strip()
+_git_dir_cache: Dict[str, Path | None] = {}
+"""Cache of `find_git_directory` results keyed by working directory."""
 
 
 def find_git_directory() -> Path | None:
     """
     Recurse up directories until we find a .git folder, otherwise bail.
+
+    Results are cached per working directory; call
+    `find_git_directory.cache_clear()` if `.git` moved within a process.
     """
+    key = os.getcwd()
+    if key in _git_dir_cache:
+        return _git_dir_cache[key]
+
+    result = _find_git_directory()
+    _git_dir_cache[key] = result
+    return result
+
+
+find_git_directory.cache_clear = _git_dir_cache.clear  # type: ignore[attr-defined]
+
 
-    cwd = Path(".").absolute()
+def _find_git_directory() -> Path | None:
+    """Do the actual parent walk for `find_git_directory`."""
 
-    # little hack: iterate through this directory and all its parents
-    for path in [cwd, *cwd.parents]:
-        gitpath = path / Path(".git")
-        if gitpath.exists() and gitpath.is_dir():
-            # found a match
-            return gitpath
+    # walk up with plain strings: one stat per level, no Path allocations
+    cwd = os.path.abspath(".")
+    while True:
+        candidate = os.path.join(cwd, ".git")
+        try:
+            if stat.S_ISDIR(os.stat(candidate).st_mode):
+                # found a match
+                return Path(candidate)
+        except OSError:  # missing (or not listable); keep going up
+            pass
 
-    return None
+        parent = os.path.dirname(cwd)
+        if parent == cwd:  # hit the filesystem root
+            return None
+        cwd = parent
 
 
-def create_list_of_hooks(tasks: Tasks) -> List[Tuple[str, str]]:
+def create_list_of_hooks(tasks: Tasks) -> List[Tuple[str, str, bytes]]:
     """
     Create a list of git hook script filenames and contents.
 
     Does not actually modify the filesystem, only creates a listing.
 
     Returns:
-        List[Tuple[str, str]]: List of (filename, contents) pairs
+        List[Tuple[str, str, bytes]]: List of (filename, contents,
+        encoded contents) triples; the bytes are shared by the
+        validate/install paths to avoid re-encoding per comparison.
     """
 
-    hooks: List[Tuple[str, str]] = []
-
-    # list of valid hook names prefixed by the specified prefix
-    search_list = set([f"{GIT_HOOK_PREFIX}{n}" for n in VALID_GIT_HOOKS])
+    hooks: List[Tuple[str, str, bytes]] = []
 
     for task in tasks:
         # skip immediately
-        if task not in search_list:
+        if task not in _PREFIXED_HOOKS_SET:
             continue
 
-        hook_name = task.replace(GIT_HOOK_PREFIX, "")
+        hook_name = task[len(GIT_HOOK_PREFIX) :]
+        body = create_hook_template(hook_name)
 
-        hooks.append((hook_name, create_hook_template(hook_name)))
+        hooks.append((hook_name, body, body.encode()))
 
     return hooks
 
@@ -130,60 +152,104 @@ def detect_installed_hooks(git_dir: Path) -> List[str]:
     hook_dir = git_dir / "hooks"
 
     detected_hooks = []
-    for hook in hook_dir.iterdir():
-        # this is usually filled with hookname.sample files, so we'll filter for just those with valid names
-        if hook.name not in VALID_GIT_HOOKS:
-            continue
+    with os.scandir(hook_dir) as entries:
+        for entry in entries:
+            # this is usually filled with hookname.sample files, so we'll filter for just those with valid names
+            if entry.name not in _VALID_HOOKS_SET:
+                continue
 
-        # if this isn't a file, ignore it as well
-        if not hook.is_file():
-            continue
+            # if this isn't a file (following symlinks), ignore it as well
+            if not entry.is_file():
+                continue
 
-        detected_hooks.append(hook.name)
+            detected_hooks.append(entry.name)
 
     return detected_hooks
 
 
 def validate_installed_hooks(git_dir: Path, tasks: Tasks) -> bool:
-    installed_hooks = detect_installed_hooks(git_dir)
     target_hooks = create_list_of_hooks(tasks)
 
     # early abort: if we haven't specified any hooks, none of this applies and we're good
     if len(target_hooks) == 0:
         return True
 
-    # strategy: zip together detected and target hooks (sorted) and if we get a mismatch
-    installed_hooks.sort()
-    target_hooks.sort(key=lambda h: h[0])  # sort by filename
-
-    if len(installed_hooks) != len(target_hooks):
+    # strategy: compare the name sets first so a mismatch costs no file reads
+    target_map = {name: body_bytes for name, _, body_bytes in target_hooks}
+    installed_hooks = set(detect_installed_hooks(git_dir))
+    if installed_hooks != target_map.keys():
         return False
 
-    for installed_name, (target_name, target_body) in zip(
-        installed_hooks, target_hooks
-    ):
-        if installed_name != target_name:
+    # names all match; now compare bodies (bytes, to skip the utf-8 decode)
+    for name, body_bytes in target_map.items():
+        hook_path = git_dir / "hooks" / name
+
+        # a drifted body almost always has a different length, so check
+        # the size from a cheap stat before reading the whole file
+        if os.stat(hook_path).st_size != len(body_bytes):
             return False
 
-        installed_body = (git_dir / "hooks" / installed_name).read_text()
-        if installed_body != target_body:
+        if hook_path.read_bytes() != body_bytes:
             return False
 
     return True
 
 
-def force_install_hooks(git_dir: Path, tasks: Tasks) -> None:
-    installed_hooks = detect_installed_hooks(git_dir)
-    target_hooks = create_list_of_hooks(tasks)
+def _write_executable(path: Path, data: bytes) -> None:
+    """
+    Write `data` to `path`, marking it executable on creation.
 
-    # remove old hooks
-    for hook in installed_hooks:
-        hook_path = git_dir / "hooks" / hook
-        hook_path.unlink()
-
-    # create new ones
-    for hook, body in target_hooks:
-        hook_path = git_dir / "hooks" / hook
-        hook_path.write_text(body)
-        # make sure to mark them executable on real systems (ie not windows)
-        hook_path.chmod(hook_path.stat().st_mode | stat.S_IEXEC)
+    Opening with mode 0o755 sets the executable bit up front (subject to
+    umask), so there is no separate stat + chmod round-trip. On systems
+    without executable bits (ie windows) the mode is simply ignored.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def force_install_hooks(git_dir: Path, tasks: Tasks) -> None:
+    installed_hooks = set(detect_installed_hooks(git_dir))
+    target_map = {
+        name: body_bytes for name, _, body_bytes in create_list_of_hooks(tasks)
+    }
+
+    hooks_dir = git_dir / "hooks"
+
+    def _remove_one(hook: str) -> None:
+        (hooks_dir / hook).unlink()
+
+    def _install_one(pair: Tuple[str, bytes]) -> None:
+        hook, body_bytes = pair
+        hook_path = hooks_dir / hook
+        # remove any old file first so the 0o755 creation mode applies;
+        # O_TRUNC alone would keep a drifted hook's old (maybe non-exec) mode
+        hook_path.unlink(missing_ok=True)
+        _write_executable(hook_path, body_bytes)
+
+    def _needs_install(name: str, body_bytes: bytes) -> bool:
+        if name not in installed_hooks:
+            return True
+
+        # repair hooks that lost their exec bit even if the body matches;
+        # the stat is cheaper than the read, so check it first
+        hook_path = hooks_dir / name
+        if not os.stat(hook_path).st_mode & stat.S_IEXEC:
+            return True
+
+        return hook_path.read_bytes() != body_bytes
+
+    # only touch the deltas: remove stale hooks, rewrite missing/drifted ones
+    stale = installed_hooks - target_map.keys()
+    changed = [
+        (name, body_bytes)
+        for name, body_bytes in target_map.items()
+        if _needs_install(name, body_bytes)
+    ]
+
+    # the GIL is released around file I/O, so a few workers overlap the syscalls
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_remove_one, stale))
+        list(pool.map(_install_one, changed))
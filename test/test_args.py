@@ -4,6 +4,9 @@
 from pathlib import Path
 from shlex import split
 
+# lib
+import pytest
+
 # pkg
 from ds.args import Args
 from ds.symbols import ARG_BEG
@@ -59,6 +62,36 @@ def test_parse_options() -> None:
     assert Args.parse(split(f"-w{GLOB_ALL}")) == Args(list_=True, workspace=[GLOB_ALL])
 
 
+def test_parse_cache_follows_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Re-parsing the same argv in a new directory resolves paths there."""
+    dir_a = tmp_path / "a"
+    dir_b = tmp_path / "b"
+    dir_a.mkdir()
+    dir_b.mkdir()
+
+    monkeypatch.chdir(dir_a)
+    assert Args.parse(split("--file ds.toml")).file == (dir_a / "ds.toml").resolve()
+
+    monkeypatch.chdir(dir_b)
+    assert Args.parse(split("--file ds.toml")).file == (dir_b / "ds.toml").resolve()
+
+
+def test_parse_cache_not_poisoned() -> None:
+    """Mutating one parse result must not leak into later parses."""
+    argv = split("echo: hello")
+
+    first = Args.parse(argv)
+    first.env["DS_TEST"] = "1"
+    first.task.depends.clear()
+
+    second = Args.parse(argv)
+    assert "DS_TEST" not in second.env
+    assert second.task.depends
+    assert second.task.env is second.env  # aliasing set up by parse
+
+
 def test_parse_no_args() -> None:
     """Tasks without arguments."""
     assert Args.parse(split("a b c")) == Args(
@@ -2,6 +2,7 @@
 
 # std
 from pathlib import Path
+import stat
 
 # lib
 import sys
@@ -210,6 +211,64 @@ def test_check_hooks_installed_all_ok(tmp_path: Path) -> None:
     assert validate_installed_hooks(tmp_path, tasks)
 
 
+def test_force_install_skips_matching_hooks(tmp_path: Path) -> None:
+    # create some hooks; pre-rebase already matches its template
+    _create_hook_dir(tmp_path)
+
+    tasks: Tasks = {
+        f"{GIT_HOOK_PREFIX}pre-rebase": parse_task("echo hello world"),
+    }
+
+    # matching means correct body *and* executable
+    hook_path = tmp_path / "hooks" / "pre-rebase"
+    hook_path.chmod(0o755)
+    before = hook_path.stat()
+
+    force_install_hooks(tmp_path, tasks)
+
+    # the matching hook was not rewritten (same inode, same mtime)
+    after = hook_path.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+def test_force_install_marks_drifted_hooks_executable(tmp_path: Path) -> None:
+    # create some hooks; pre-commit exists but has the wrong body
+    _create_hook_dir(tmp_path)
+
+    tasks: Tasks = {
+        f"{GIT_HOOK_PREFIX}pre-commit": parse_task("echo it worked"),
+    }
+
+    # simulate a hand-edited, non-executable hook
+    hook_path = tmp_path / "hooks" / "pre-commit"
+    hook_path.chmod(0o644)
+
+    force_install_hooks(tmp_path, tasks)
+
+    # the body was fixed and the hook is executable again
+    assert hook_path.read_text() == create_hook_template("pre-commit")
+    assert hook_path.stat().st_mode & stat.S_IEXEC
+
+
+def test_force_install_repairs_lost_exec_bit(tmp_path: Path) -> None:
+    # create some hooks; pre-rebase already matches its template
+    _create_hook_dir(tmp_path)
+
+    tasks: Tasks = {
+        f"{GIT_HOOK_PREFIX}pre-rebase": parse_task("echo hello world"),
+    }
+
+    # simulate a hook whose body matches but which lost its exec bit
+    hook_path = tmp_path / "hooks" / "pre-rebase"
+    hook_path.chmod(0o644)
+
+    force_install_hooks(tmp_path, tasks)
+
+    # the body is untouched and the hook is executable again
+    assert hook_path.read_text() == create_hook_template("pre-rebase")
+    assert hook_path.stat().st_mode & stat.S_IEXEC
+
+
 def test_force_install_hooks(tmp_path: Path) -> None:
     # create some hooks
     _create_hook_dir(tmp_path)